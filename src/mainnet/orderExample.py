@@ -1,65 +1,224 @@
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional
 from binance.um_futures import UMFutures
-from binance.error import ClientError
+from binance.error import ClientError, ServerError
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from decimal import Decimal
+from requests.adapters import HTTPAdapter
+from requests.exceptions import RequestException
+import atexit
 import logging
+import logging.handlers
+import queue
 from pathlib import Path
 import os
 import math
 import json
+import orjson
 import sys
-from decimal import Decimal, ROUND_DOWN
 import time
 import configparser
+import functools
 
+def _configure_logging() -> None:
+    """ログ設定（プロセス内で一度だけ）
+
+    クライアントを何個作ってもハンドラは増やさない。ファイルI/Oは
+    QueueListenerの専用スレッドに逃がし、発注スレッドはキューに積むだけ。
+    ログファイルはdelay=Trueで初回書き込みまで開かない。
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return
+
+    os.makedirs("logs", exist_ok=True)
+    formatter = logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    file_handler = logging.handlers.RotatingFileHandler(
+        "logs/trading.log",
+        maxBytes=10 * 1024 * 1024,
+        backupCount=5,
+        delay=True
+    )
+    stream_handler = logging.StreamHandler()
+    for handler in (file_handler, stream_handler):
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, stream_handler
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
+    root.setLevel(logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+def _use_orjson_responses(session):
+    """レスポンスのJSONデコードをorjsonに差し替える
+
+    binance-futures-connectorは内部でresponse.json()を呼ぶため、
+    セッションが返すレスポンスのjson()をorjson.loadsに向ける。
+    """
+    original_request = session.request
+
+    def request_with_orjson(*args, **kwargs):
+        response = original_request(*args, **kwargs)
+        response.json = lambda **_: orjson.loads(response.content)
+        return response
+
+    session.request = request_with_orjson
+
+# exchange_infoのディスクキャッシュ（シンボルフィルタは滅多に変わらない）
+EXCHANGE_INFO_CACHE_TTL = 6 * 60 * 60  # 6時間
+
+def _exchange_info_cache_path(is_testnet: bool) -> Path:
+    """環境ごとのexchange_infoキャッシュファイルのパス
+
+    テストネットとメインネットはシンボル構成もフィルタ値も異なるため、
+    キャッシュを共有してはいけない。
+    """
+    env = "testnet" if is_testnet else "mainnet"
+    return Path(f"logs/exchange_info_{env}.json")
+
+@functools.lru_cache(maxsize=1)
+def _load_api_config() -> configparser.ConfigParser:
+    """API設定ファイルの読み込み（プロセス内で一度だけパースする）"""
+    config = configparser.ConfigParser()
+    config_path = Path("settings/config.ini")
+    config.read(config_path)
+
+    required_keys = ['API_KEY', 'API_SECRET']
+    for key in required_keys:
+        if not config['BINANCE'].get(key):
+            raise ValueError(f"Missing required config key: {key}")
+
+    return config
+
+@functools.lru_cache(maxsize=1)
+def _load_parameter_config() -> configparser.ConfigParser:
+    """トレードパラメータファイルの読み込み（プロセス内で一度だけパースする）"""
+    param_config = configparser.ConfigParser()
+    param_path = Path("settings/parameter.ini")
+    if not param_path.exists():
+        raise FileNotFoundError("Parameter file not found at settings/parameter.ini")
+    param_config.read(param_path)
+    return param_config
+
+@functools.lru_cache(maxsize=1)
+def _check_environment() -> bool:
+    """必要なディレクトリとファイルの存在確認（プロセス内で一度だけ）"""
+    required_dirs = ['logs', 'settings']
+    required_files = ['settings/config.ini', 'settings/parameter.ini']
+
+    for dir_path in required_dirs:
+        if not os.path.exists(dir_path):
+            os.makedirs(dir_path)
+
+    for file_path in required_files:
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"Required file not found: {file_path}")
+
+    return True
+
+@dataclass(slots=True, frozen=True)
 class SymbolInfo:
-    def __init__(self, symbol_data: Dict):
-        self.symbol = symbol_data['symbol']
-        self.price_precision = symbol_data['pricePrecision']
-        self.quantity_precision = symbol_data['quantityPrecision']
-        self.min_price = float(symbol_data['filters'][0]['minPrice'])
-        self.max_price = float(symbol_data['filters'][0]['maxPrice'])
-        self.tick_size = float(symbol_data['filters'][0]['tickSize'])
-        self.min_qty = float(symbol_data['filters'][1]['minQty'])
-        self.max_qty = float(symbol_data['filters'][1]['maxQty'])
-        self.step_size = float(symbol_data['filters'][1]['stepSize'])
-        self.min_notional = float(symbol_data['filters'][5]['notional'])
+    """シンボル情報（__slots__化でインスタンス辞書を持たない）"""
+    symbol: str
+    price_precision: int
+    quantity_precision: int
+    min_price: float
+    max_price: float
+    tick_size: float
+    min_qty: float
+    max_qty: float
+    step_size: float
+    min_notional: float
+    _tick_prec: int = field(init=False, repr=False)
+    _inv_tick: int = field(init=False, repr=False)
+    _step_prec: int = field(init=False, repr=False)
+    _inv_step: int = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # 丸め精度と逆数を一度だけ計算しておく（呼び出しごとのDecimal構築を
+        # 避ける）。精度はmath.log10ではなく文字列表現の小数桁数から決める:
+        # 0.005のような非10べき乗tickでlog10は桁を1つ落とし、tickの倍数で
+        # ない値を返してしまう
+        object.__setattr__(
+            self, '_tick_prec',
+            max(0, -Decimal(str(self.tick_size)).as_tuple().exponent)
+        )
+        object.__setattr__(self, '_inv_tick', round(1 / self.tick_size))
+        object.__setattr__(
+            self, '_step_prec',
+            max(0, -Decimal(str(self.step_size)).as_tuple().exponent)
+        )
+        object.__setattr__(self, '_inv_step', round(1 / self.step_size))
+
+    @classmethod
+    def from_symbol_data(cls, symbol_data: Dict) -> "SymbolInfo":
+        """exchange_infoから取得したシンボル情報をもとに構築する"""
+        return cls(
+            symbol=symbol_data['symbol'],
+            price_precision=symbol_data['pricePrecision'],
+            quantity_precision=symbol_data['quantityPrecision'],
+            min_price=float(symbol_data['filters'][0]['minPrice']),
+            max_price=float(symbol_data['filters'][0]['maxPrice']),
+            tick_size=float(symbol_data['filters'][0]['tickSize']),
+            min_qty=float(symbol_data['filters'][1]['minQty']),
+            max_qty=float(symbol_data['filters'][1]['maxQty']),
+            step_size=float(symbol_data['filters'][1]['stepSize']),
+            min_notional=float(symbol_data['filters'][5]['notional'])
+        )
 
     def round_step_size(self, quantity: float) -> float:
         """数量をstep_sizeに合わせて丸める（切り捨て）"""
-        step_size = Decimal(str(self.step_size))
-        quantity = Decimal(str(quantity))
-        return float(quantity.quantize(step_size.normalize(), rounding=ROUND_DOWN))
+        # floor前のroundは 0.015 * 200 == 2.9999... のような表現誤差の吸収
+        ticks = math.floor(round(quantity * self._inv_step, 9))
+        return round(ticks / self._inv_step, self._step_prec)
 
     def round_tick_size(self, price: float) -> float:
         """価格をtick_sizeに合わせて丸める（切り捨て）"""
-        tick_size = Decimal(str(self.tick_size))
-        price = Decimal(str(price))
-        return float(price.quantize(tick_size.normalize(), rounding=ROUND_DOWN))
+        ticks = math.floor(round(price * self._inv_tick, 9))
+        return round(ticks / self._inv_tick, self._tick_prec)
 
+@dataclass(slots=True, frozen=True)
 class TradingParameters:
-    def __init__(self, symbol: str, leverage: int, side: str, 
-                 order_type: str, usdt_amount: float, reduce_only: bool = False):
-        self.symbol = symbol
-        self.leverage = leverage
-        self.side = "BUY" if side.upper() == "LONG" else "SELL"
-        self.order_type = order_type.upper()
-        self.usdt_amount = usdt_amount
-        self.reduce_only = reduce_only
+    symbol: str
+    leverage: int
+    side: str
+    order_type: str
+    usdt_amount: float
+    reduce_only: bool = False
+
+    def __post_init__(self):
+        # LONG/SHORT表記を発注用のBUY/SELLに正規化する
+        object.__setattr__(
+            self, 'side', "BUY" if self.side.upper() == "LONG" else "SELL"
+        )
+        object.__setattr__(self, 'order_type', self.order_type.upper())
 
 class BinanceFuturesClient:
-    def __init__(self, is_testnet: bool = False):
+    def __init__(self, is_testnet: bool = False,
+                 confirm: Optional[Callable[[Dict], bool]] = None):
         """
         Binance Futures クライアントの初期化
         Args:
             is_testnet (bool): テストネットを使用するかどうか（デフォルトはメインネット）
+            confirm (Optional[Callable[[Dict], bool]]):
+                メインネット実行確認のコールバック。注文内容のDictを受け取り、
+                Falseを返すと実行を中止する。指定時はinput()プロンプトを出さない。
         """
+        self._confirm = confirm
+        self._is_testnet = is_testnet
         self._validate_environment()
         self.config = self._load_configs()
         self.trading_params = self._load_trading_parameters()
         self.client = self._initialize_client(is_testnet)
         self._setup_logging()
         self.symbol_info = self._get_symbol_info(self.trading_params.symbol)
-        self.logger.info(f"Symbol info loaded: {vars(self.symbol_info)}")
+        self.logger.info("Symbol info loaded: %s", self.symbol_info)
         
         # 実行前の確認
         if not is_testnet:
@@ -67,19 +226,33 @@ class BinanceFuturesClient:
 
     def _validate_environment(self):
         """必要なディレクトリとファイルの存在確認"""
-        required_dirs = ['logs', 'settings']
-        required_files = ['settings/config.ini', 'settings/parameter.ini']
-        
-        for dir_path in required_dirs:
-            if not os.path.exists(dir_path):
-                os.makedirs(dir_path)
-                
-        for file_path in required_files:
-            if not os.path.exists(file_path):
-                raise FileNotFoundError(f"Required file not found: {file_path}")
+        _check_environment()
+
+    def _setup_logging(self):
+        """ログ設定"""
+        _configure_logging()
+        self.logger = logging.getLogger(__name__)
+
+    def _should_prompt(self) -> bool:
+        """対話プロンプトを出すべきか
+
+        サーバー実行やワーカー経由の自動実行ではstdinがttyではないため、
+        ブロッキングなinput()を発注経路から外す。BINANCE_CONFIRM=0でも無効化できる。
+        """
+        return sys.stdin.isatty() and os.environ.get('BINANCE_CONFIRM', '1') == '1'
 
     def _confirm_mainnet_execution(self):
         """メインネットでの実行確認"""
+        if self._confirm is not None:
+            if not self._confirm(asdict(self.trading_params)):
+                self.logger.info("Mainnet execution cancelled by confirm callback")
+                sys.exit("Execution cancelled")
+            return
+
+        if not self._should_prompt():
+            self.logger.info("Non-interactive mode: skipping mainnet confirmation")
+            return
+
         print("\n" + "!"*50)
         print("WARNING: You are about to execute trades on MAINNET")
         print("Symbol:", self.trading_params.symbol)
@@ -97,16 +270,170 @@ class BinanceFuturesClient:
 
     def _load_configs(self) -> Dict:
         """API設定ファイルの読み込み"""
-        config = configparser.ConfigParser()
-        config_path = Path("settings/config.ini")
-        config.read(config_path)
-        
-        required_keys = ['API_KEY', 'API_SECRET']
-        for key in required_keys:
-            if not config['BINANCE'].get(key):
-                raise ValueError(f"Missing required config key: {key}")
-                
-        return config
+        return _load_api_config()
+
+    def _load_trading_parameters(self) -> TradingParameters:
+        """トレードパラメータの読み込みと検証"""
+        trading_section = _load_parameter_config()['TRADING']
+        return TradingParameters(
+            symbol=trading_section.get('SYMBOL'),
+            leverage=trading_section.getint('LEVERAGE'),
+            side=trading_section.get('SIDE'),
+            order_type=trading_section.get('ORDER_TYPE'),
+            usdt_amount=trading_section.getfloat('USDT_AMOUNT'),
+            reduce_only=trading_section.getboolean('REDUCE_ONLY', False)
+        )
+
+    def _load_exchange_info(self) -> Dict:
+        """exchange_infoの取得（環境ごとのディスクキャッシュ付き）
+
+        全シンボル分で数百KBあるペイロードのため、logs/配下に保存して
+        TTL内はネットワークアクセスなしで再利用する。
+        """
+        cache_path = _exchange_info_cache_path(self._is_testnet)
+        try:
+            cache_age = time.time() - cache_path.stat().st_mtime
+            if cache_age < EXCHANGE_INFO_CACHE_TTL:
+                return orjson.loads(cache_path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            # キャッシュなし・壊れている場合は取得し直す
+            pass
+
+        exchange_info = self.client.exchange_info()
+        cache_path.parent.mkdir(exist_ok=True)
+        tmp_path = cache_path.with_suffix('.json.tmp')
+        tmp_path.write_bytes(orjson.dumps(exchange_info))
+        os.replace(tmp_path, cache_path)  # 読み手が中途半端な状態を見ないよう置換
+        return exchange_info
+
+    def _get_symbol_info(self, symbol: str) -> SymbolInfo:
+        """シンボル情報の取得"""
+        try:
+            # 構築時に一度だけ取得してキャッシュし、発注経路では再取得しない
+            self._exchange_info = self._load_exchange_info()
+            self._symbol_index = {
+                item['symbol']: item for item in self._exchange_info['symbols']
+            }
+            symbol_info = self._symbol_index.get(symbol)
+            if not symbol_info:
+                raise ValueError(f"Symbol {symbol} not found in exchange info")
+            return SymbolInfo.from_symbol_data(symbol_info)
+        except (ClientError, ServerError, RequestException) as e:
+            self.logger.error("Failed to get symbol info: %s", str(e))
+            raise
+
+    def _get_current_price(self, symbol: str) -> float:
+        """現在の価格を取得"""
+        try:
+            ticker = self.client.mark_price(symbol=symbol)
+            return float(ticker['markPrice'])
+        except ClientError as e:
+            self.logger.error("Failed to get current price: %s", e.error_message)
+            raise
+
+    def _set_leverage(self, symbol: str, leverage: int):
+        """レバレッジを設定"""
+        try:
+            self.client.change_leverage(
+                symbol=symbol,
+                leverage=leverage
+            )
+            self.logger.info("Leverage set to %sx for %s", leverage, symbol)
+        except ClientError as e:
+            self.logger.error("Failed to set leverage: %s", e.error_message)
+            raise
+
+    def _calculate_quantity(self, usdt_amount: float, current_price: float) -> float:
+        """USDTベースの数量から実際の取引数量を計算"""
+        # 最小注文金額のチェックと調整
+        if usdt_amount < self.symbol_info.min_notional:
+            self.logger.warning(
+                "USDT amount %s is less than minimum notional %s. "
+                "Adjusting to minimum notional.",
+                usdt_amount, self.symbol_info.min_notional
+            )
+            usdt_amount = self.symbol_info.min_notional
+
+        raw_quantity = usdt_amount / current_price
+
+        # 最小数量チェック
+        if raw_quantity < self.symbol_info.min_qty:
+            # 最小数量を使用し、それに見合うようにUSDT金額を増やす
+            raw_quantity = self.symbol_info.min_qty
+            adjusted_usdt = raw_quantity * current_price
+            if adjusted_usdt < self.symbol_info.min_notional:
+                raw_quantity = self.symbol_info.min_notional / current_price
+                self.logger.warning(
+                    "Adjusted quantity to meet minimum notional requirement. "
+                    "New quantity: %s", raw_quantity
+                )
+
+        # 最大数量チェック
+        if raw_quantity > self.symbol_info.max_qty:
+            self.logger.warning(
+                "Calculated quantity %s is more than maximum allowed %s. "
+                "Adjusting to maximum quantity.",
+                raw_quantity, self.symbol_info.max_qty
+            )
+            raw_quantity = self.symbol_info.max_qty
+
+        # step sizeに合わせて丸める
+        final_quantity = self.symbol_info.round_step_size(raw_quantity)
+
+        # 最終チェック: 注文の名目価値
+        notional_value = final_quantity * current_price
+        if notional_value < self.symbol_info.min_notional:
+            self.logger.warning(
+                "Final order notional value (%s USDT) is less than minimum required "
+                "(%s USDT). Adjusting quantity.",
+                notional_value, self.symbol_info.min_notional
+            )
+            final_quantity = math.ceil(self.symbol_info.min_notional / current_price * 1000) / 1000
+
+        self.logger.info(
+            "Quantity calculation: USDT Amount: %s, Price: %s, "
+            "Final Quantity: %s, Notional Value: %s",
+            usdt_amount, current_price, final_quantity,
+            final_quantity * current_price
+        )
+
+        return final_quantity
+
+    def place_order(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str,
+        quantity: float,
+        reduce_only: bool = False,
+        price: Optional[float] = None,
+        time_in_force: str = "GTC"
+    ) -> Dict:
+        """注文を発注する"""
+        try:
+            params = {
+                "symbol": symbol,
+                "side": side,
+                "type": order_type,
+                "quantity": quantity,
+                "reduceOnly": reduce_only
+            }
+
+            if order_type == "LIMIT":
+                if price is None:
+                    raise ValueError("Price is required for LIMIT orders")
+                params.update({
+                    "price": price,
+                    "timeInForce": time_in_force
+                })
+
+            response = self.client.new_order(**params)
+            self.logger.info("Order placed successfully: %s", response)
+            return response
+
+        except ClientError as e:
+            self.logger.error("Failed to place order: %s", e.error_message)
+            raise
 
     def _initialize_client(self, is_testnet: bool) -> UMFutures:
         """Binance Futuresクライアントの初期化"""
@@ -124,38 +451,54 @@ class BinanceFuturesClient:
             secret=api_secret,
             base_url=base_url
         )
-        
-        # APIキーの有効性確認
+
+        # 接続を永続化し、呼び出しごとのTLSハンドシェイクを1プロセス1回に抑える
+        client.session.mount('https://', HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=50,
+            pool_block=False
+        ))
+        client.session.headers['Connection'] = 'keep-alive'
+        _use_orjson_responses(client.session)
+
+        # APIキーの有効性確認（レスポンスは残高キャッシュとして保持し、
+        # 発注ごとのaccount()照会をなくす）
         try:
-            client.account()
+            account_info = client.account()
         except ClientError as e:
             raise ValueError(f"Invalid API credentials: {str(e)}")
-            
+
+        assets_by_name = {
+            asset['asset']: asset for asset in account_info['assets']
+        }
+        self._cached_balance = float(assets_by_name['USDT']['availableBalance'])
         return client
 
     def prepare_and_place_order(self) -> Dict:
         """パラメータに基づいて注文を準備して発注"""
         try:
-            # アカウントの残高確認
-            account_info = self.client.account()
-            available_balance = float(next(
-                asset['availableBalance'] 
-                for asset in account_info['assets'] 
-                if asset['asset'] == 'USDT'
-            ))
-            
-            if available_balance < self.trading_params.usdt_amount:
-                raise ValueError(
-                    f"Insufficient balance. Required: {self.trading_params.usdt_amount} USDT, "
-                    f"Available: {available_balance} USDT"
+            # レバレッジ設定と価格取得は互いに依存しないため並行実行
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                leverage_future = executor.submit(
+                    self._set_leverage,
+                    self.trading_params.symbol,
+                    self.trading_params.leverage
+                )
+                price_future = executor.submit(
+                    self._get_current_price, self.trading_params.symbol
+                )
+                leverage_future.result()
+                current_price = price_future.result()
+
+            # 残高は発注ごとに照会しない。起動時のキャッシュで早期警告だけ出し、
+            # 実際の不足はBinance側の-2019エラーで検出する
+            if self._cached_balance < self.trading_params.usdt_amount:
+                self.logger.warning(
+                    "Cached balance %s USDT is below order amount %s USDT; "
+                    "the order may be rejected",
+                    self._cached_balance, self.trading_params.usdt_amount
                 )
 
-            # レバレッジを設定
-            self._set_leverage(self.trading_params.symbol, self.trading_params.leverage)
-            
-            # 現在価格を取得
-            current_price = self._get_current_price(self.trading_params.symbol)
-            
             # 数量を計算
             quantity = self._calculate_quantity(
                 self.trading_params.usdt_amount, 
@@ -181,27 +524,41 @@ class BinanceFuturesClient:
                 order_params["price"] = price
                 order_params["time_in_force"] = "GTC"
                 
-            self.logger.info(f"Placing order with params: {order_params}")
+            self.logger.info("Placing order with params: %s", order_params)
             
             # 最終確認（メインネットの場合）
             if not hasattr(self, '_confirmed_mainnet') and not self.client.base_url.startswith('https://testnet'):
-                print("\nOrder Details:")
-                print(json.dumps(order_params, indent=2))
-                confirmation = input("\nType 'CONFIRM' to place the order: ")
-                if confirmation != "CONFIRM":
-                    raise ValueError("Order cancelled by user")
+                if self._confirm is not None:
+                    if not self._confirm(order_params):
+                        raise ValueError("Order cancelled by confirm callback")
+                elif self._should_prompt():
+                    print("\nOrder Details:")
+                    print(json.dumps(order_params, indent=2))
+                    confirmation = input("\nType 'CONFIRM' to place the order: ")
+                    if confirmation != "CONFIRM":
+                        raise ValueError("Order cancelled by user")
                 self._confirmed_mainnet = True
-                
-            response = self.place_order(**order_params)
+
+            try:
+                response = self.place_order(**order_params)
+            except ClientError as e:
+                if e.error_code == -2019:
+                    raise ValueError(
+                        f"Insufficient margin for {order_params['quantity']} "
+                        f"{order_params['symbol']} "
+                        f"(balance at startup: {self._cached_balance} USDT)"
+                    ) from e
+                raise
             
-            # 注文後の情報ログ
+            # 注文後の情報ログ（レスポンス全文のダンプはDEBUG時のみ）
             self.logger.info("Order placed successfully")
-            self.logger.info(f"Order Response: {json.dumps(response, indent=2)}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Order Response: %s", orjson.dumps(response).decode())
             
             return response
             
-        except Exception as e:
-            self.logger.error(f"Error in prepare_and_place_order: {str(e)}")
+        except (ClientError, ServerError, RequestException, ValueError) as e:
+            self.logger.error("Error in prepare_and_place_order: %s", str(e))
             raise
 
     def get_position_info(self) -> Dict:
@@ -210,10 +567,10 @@ class BinanceFuturesClient:
             positions = self.client.get_position_risk(
                 symbol=self.trading_params.symbol
             )
-            self.logger.info(f"Position info retrieved: {positions}")
+            self.logger.info("Position info retrieved: %s", positions)
             return positions
         except ClientError as e:
-            self.logger.error(f"Failed to get position info: {e.error_message}")
+            self.logger.error("Failed to get position info: %s", e.error_message)
             raise
 
 if __name__ == "__main__":
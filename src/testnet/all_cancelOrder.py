@@ -1,9 +1,40 @@
 import configparser
+import functools
 from binance.um_futures import UMFutures
 from binance.error import ClientError
+from requests.adapters import HTTPAdapter
 import logging
 from pathlib import Path
 from typing import List, Dict
+import orjson
+
+# DELETE /fapi/v1/batchOrders が1リクエストで受け付ける最大注文数
+MAX_BATCH_CANCELS = 10
+
+def _use_orjson_responses(session):
+    """レスポンスのJSONデコードをorjsonに差し替える
+
+    binance-futures-connectorは内部でresponse.json()を呼ぶため、
+    セッションが返すレスポンスのjson()をorjson.loadsに向ける。
+    """
+    original_request = session.request
+
+    def request_with_orjson(*args, **kwargs):
+        response = original_request(*args, **kwargs)
+        response.json = lambda **_: orjson.loads(response.content)
+        return response
+
+    session.request = request_with_orjson
+
+@functools.lru_cache(maxsize=1)
+def _load_api_config() -> configparser.ConfigParser:
+    """API設定ファイルの読み込み（プロセス内で一度だけパースする）"""
+    config = configparser.ConfigParser()
+    config_path = Path("settings/config.ini")
+    if not config_path.exists():
+        raise FileNotFoundError("Config file not found at settings/config.ini")
+    config.read(config_path)
+    return config
 
 class OrderManager:
     def __init__(self, is_testnet: bool = True):
@@ -18,12 +49,7 @@ class OrderManager:
 
     def _load_configs(self) -> configparser.ConfigParser:
         """API設定ファイルの読み込み"""
-        config = configparser.ConfigParser()
-        config_path = Path("settings/config.ini")
-        if not config_path.exists():
-            raise FileNotFoundError("Config file not found at settings/config.ini")
-        config.read(config_path)
-        return config
+        return _load_api_config()
 
     def _initialize_client(self, is_testnet: bool) -> UMFutures:
         """Binance Futuresクライアントの初期化"""
@@ -31,18 +57,29 @@ class OrderManager:
         api_secret = self.config['BINANCE']['API_SECRET']
         
         base_url = "https://testnet.binancefuture.com" if is_testnet else None
-        return UMFutures(
+        client = UMFutures(
             key=api_key,
             secret=api_secret,
             base_url=base_url
         )
+        # 接続を永続化し、呼び出しごとのTLSハンドシェイクを1プロセス1回に抑える
+        client.session.mount('https://', HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=50,
+            pool_block=False
+        ))
+        client.session.headers['Connection'] = 'keep-alive'
+        _use_orjson_responses(client.session)
+        return client
 
     def _setup_logging(self):
         """ロギングの設定"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
+        # 複数インスタンスでもハンドラを重ねて登録しない
+        if not logging.getLogger().handlers:
+            logging.basicConfig(
+                level=logging.INFO,
+                format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            )
         self.logger = logging.getLogger(__name__)
 
     def get_open_orders(self, symbol: str = None) -> List[Dict]:
@@ -59,11 +96,11 @@ class OrderManager:
                 params['symbol'] = symbol
 
             open_orders = self.client.get_orders(**params)
-            self.logger.info(f"Retrieved {len(open_orders)} open orders")
+            self.logger.info("Retrieved %s open orders", len(open_orders))
             return open_orders
 
         except ClientError as e:
-            self.logger.error(f"Failed to get open orders: {e.error_message}")
+            self.logger.error("Failed to get open orders: %s", e.error_message)
             raise
 
     def cancel_order(self, symbol: str, order_id: int) -> Dict:
@@ -80,16 +117,48 @@ class OrderManager:
                 symbol=symbol,
                 orderId=order_id
             )
-            self.logger.info(f"Successfully cancelled order {order_id}")
+            self.logger.info("Successfully cancelled order %s", order_id)
             return response
 
         except ClientError as e:
-            self.logger.error(f"Failed to cancel order {order_id}: {e.error_message}")
+            self.logger.error("Failed to cancel order %s: %s", order_id, e.error_message)
+            raise
+
+    def cancel_orders_batch(self, symbol: str, order_ids: List[int]) -> List[Dict]:
+        """
+        複数の注文をDELETE /fapi/v1/batchOrdersでまとめてキャンセル
+
+        1リクエストあたり最大10件のため、10件ずつに分割して送信する。
+        1件ずつのcancel_orderに比べてラウンドトリップを1/10に削減できる。
+        Args:
+            symbol (str): 取引ペア
+            order_ids (List[int]): キャンセルする注文IDのリスト
+        Returns:
+            List[Dict]: 各注文のキャンセル結果のリスト
+        """
+        try:
+            responses = []
+            for i in range(0, len(order_ids), MAX_BATCH_CANCELS):
+                chunk = order_ids[i:i + MAX_BATCH_CANCELS]
+                response = self.client.cancel_batch_order(
+                    symbol=symbol,
+                    orderIdList=chunk,
+                    origClientOrderIdList=[]
+                )
+                responses.extend(response)
+                self.logger.info("Cancelled batch of %s orders", len(chunk))
+            return responses
+
+        except ClientError as e:
+            self.logger.error("Failed to cancel batch orders: %s", e.error_message)
             raise
 
     def cancel_all_open_orders(self, symbol: str = None) -> List[Dict]:
         """
         すべての未約定注文をキャンセル
+
+        注文を選別せず全てキャンセルする場合はこちらが1リクエストで済む。
+        side・価格などで絞り込む場合はcancel_orders_batchを使うこと。
         Args:
             symbol (str, optional): 特定の取引ペアの注文のみをキャンセル
         Returns:
@@ -105,7 +174,7 @@ class OrderManager:
             return response
 
         except ClientError as e:
-            self.logger.error(f"Failed to cancel all orders: {e.error_message}")
+            self.logger.error("Failed to cancel all orders: %s", e.error_message)
             raise
 
     def get_order_status(self, symbol: str, order_id: int) -> Dict:
@@ -122,11 +191,11 @@ class OrderManager:
                 symbol=symbol,
                 orderId=order_id
             )
-            self.logger.info(f"Retrieved status for order {order_id}")
+            self.logger.info("Retrieved status for order %s", order_id)
             return order_info
 
         except ClientError as e:
-            self.logger.error(f"Failed to get order status: {e.error_message}")
+            self.logger.error("Failed to get order status: %s", e.error_message)
             raise
 
 # 使用例
@@ -145,14 +214,17 @@ if __name__ == "__main__":
             cancel_result = order_manager.cancel_all_open_orders(symbol)
             print("Cancel result:", cancel_result)
         
-        # # 特定の注文をキャンセルする例
+        # # 特定の注文だけをまとめてキャンセルする例（10件ずつバッチ送信）
         # if open_orders:
-        #     first_order = open_orders[0]
-        #     cancel_result = order_manager.cancel_order(
-        #         symbol=first_order['symbol'],
-        #         order_id=first_order['orderId']
+        #     buy_order_ids = [
+        #         order['orderId'] for order in open_orders
+        #         if order['side'] == 'BUY'
+        #     ]
+        #     cancel_result = order_manager.cancel_orders_batch(
+        #         symbol=symbol,
+        #         order_ids=buy_order_ids
         #     )
-        #     print("Single order cancel result:", cancel_result)
+        #     print("Batch cancel result:", cancel_result)
         
     except Exception as e:
         print(f"Error occurred: {str(e)}")
\ No newline at end of file
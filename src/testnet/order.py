@@ -1,84 +1,406 @@
 import configparser
-from typing import Dict, Optional, Tuple
+import functools
+from typing import Dict, List, Optional, Tuple
 from binance.um_futures import UMFutures
-from binance.error import ClientError
+from binance.error import ClientError, ServerError
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from decimal import Decimal
+from requests.adapters import HTTPAdapter
+from requests.exceptions import RequestException
+import atexit
+import hashlib
+import hmac
 import logging
+import logging.handlers
+import queue
+import threading
+import uuid
+import websocket
 from pathlib import Path
 import os
 import math
+import time
+import orjson
 
-class SymbolInfo:
-    def __init__(self, symbol_data: Dict):
+# /fapi/v1/batchOrders が1リクエストで受け付ける最大注文数
+MAX_BATCH_ORDERS = 5
+
+# exchange_infoのディスクキャッシュ（シンボルフィルタは滅多に変わらない）
+EXCHANGE_INFO_CACHE_TTL = 6 * 60 * 60  # 6時間
+
+def _exchange_info_cache_path(is_testnet: bool) -> Path:
+    """環境ごとのexchange_infoキャッシュファイルのパス
+
+    テストネットとメインネットはシンボル構成もフィルタ値も異なるため、
+    キャッシュを共有してはいけない。
+    """
+    env = "testnet" if is_testnet else "mainnet"
+    return Path(f"logs/exchange_info_{env}.json")
+
+# Binance Futuresの注文レート上限: (注文数, ウィンドウ幅ns)
+ORDER_RATE_LIMITS = (
+    (10, 1_000_000_000),    # 10注文 / 1秒
+    (50, 10_000_000_000),   # 50注文 / 10秒
+)
+
+class OrderRateLimiter:
+    """注文レートのローカルトークンバケット
+
+    上限超過はIP BANを招き、数msの待機より遥かに高くつくため、
+    発注前にウィンドウ内の発注数を数えて必要な分だけ待機する。
+    タイムスタンプはtime.monotonic_ns()の整数比較で扱う。
+    """
+    def __init__(self, limits=ORDER_RATE_LIMITS):
+        self._limits = limits
+        self._timestamps = deque(maxlen=max(count for count, _ in limits))
+        self._lock = threading.Lock()
+
+    def acquire(self, count: int = 1):
+        """count注文分のトークンを取得する（必要なら待機）"""
+        for _ in range(count):
+            self._acquire_one()
+
+    def _acquire_one(self):
+        while True:
+            with self._lock:
+                now = time.monotonic_ns()
+                wait_ns = 0
+                for count, window_ns in self._limits:
+                    if len(self._timestamps) >= count:
+                        elapsed = now - self._timestamps[-count]
+                        if elapsed < window_ns:
+                            wait_ns = max(wait_ns, window_ns - elapsed)
+                if wait_ns == 0:
+                    self._timestamps.append(now)
+                    return
+            time.sleep(wait_ns / 1e9)
+
+# 全クライアント・全ワーカーで共有する（上限はIP/アカウント単位のため）
+_order_rate_limiter = OrderRateLimiter()
+
+# WebSocket注文API（REST注文より低レイテンシ）
+WS_API_MAINNET_URL = "wss://ws-fapi.binance.com/ws-fapi/v1"
+WS_API_TESTNET_URL = "wss://testnet.binancefuture.com/ws-fapi/v1"
+
+class HmacPrefixSigner:
+    """HMAC-SHA256署名器（静的プレフィックスのハッシュ状態を再利用する）
+
+    署名対象のクエリ文字列はキーのソート順で並ぶため、先頭は常に
+    静的なapiKeyフィールドになる。そこまで食わせたHMAC状態を保持し、
+    リクエストごとにはcopy()した状態へ可変部分だけを追加することで、
+    毎回ペイロード全体をハッシュし直すコストを削る。
+    """
+    def __init__(self, secret: bytes, prefix: str):
+        self._secret = secret
+        self._prefix = prefix
+        self._prefix_mac = hmac.new(secret, prefix.encode(), hashlib.sha256)
+
+    def sign(self, payload: str) -> str:
+        """payloadのHMAC-SHA256署名（16進文字列）を返す"""
+        if payload.startswith(self._prefix):
+            mac = self._prefix_mac.copy()
+            mac.update(payload[len(self._prefix):].encode())
+        else:
+            mac = hmac.new(self._secret, payload.encode(), hashlib.sha256)
+        return mac.hexdigest()
+
+class WebsocketOrderClient:
+    """WebSocket APIで注文を発注するクライアント
+
+    1本の常時接続上でorder.place / order.cancelフレームを送受信し、
+    注文ごとのTLSハンドシェイク+HTTPラウンドトリップを
+    1フレーム1RTTに置き換える。レスポンスはidごとのFutureで待ち受ける。
+    Args:
+        api_key (str): APIキー
+        api_secret (str): APIシークレット
+        is_testnet (bool): テストネットを使用するかどうか
+        timeout (float): 接続・応答待ちのタイムアウト秒数
+    """
+    def __init__(self, api_key: str, api_secret: str,
+                 is_testnet: bool = True, timeout: float = 10.0):
+        self._api_key = api_key
+        self._api_secret = api_secret.encode()
+        # ソート済みクエリ文字列の先頭は常にapiKey
+        self._signer = HmacPrefixSigner(self._api_secret, f"apiKey={api_key}&")
+        self._timeout = timeout
+        self._pending: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        url = WS_API_TESTNET_URL if is_testnet else WS_API_MAINNET_URL
+        self._ws = websocket.create_connection(url, timeout=timeout)
+        self._reader = threading.Thread(target=self._read_loop, daemon=True)
+        self._reader.start()
+
+    def _read_loop(self):
+        """受信フレームを対応するFutureに配送する"""
+        while True:
+            try:
+                message = orjson.loads(self._ws.recv())
+            except (websocket.WebSocketException, OSError, orjson.JSONDecodeError):
+                self._fail_pending(ConnectionError("WebSocket connection closed"))
+                return
+            with self._lock:
+                future = self._pending.pop(message.get("id"), None)
+            if future is not None:
+                future.set_result(message)
+
+    def _fail_pending(self, error: Exception):
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for future in pending.values():
+            future.set_exception(error)
+
+    @staticmethod
+    def _canonicalize(value) -> str:
+        """署名対象の値を送信時と同じ文字列表現に揃える
+
+        boolはstr()だとTrue/Falseになり、JSONのtrue/falseと食い違って
+        署名検証に失敗する。署名した文字列をそのままフレームに載せる。
         """
-        シンボル情報を管理するクラス
-        Args:
-            symbol_data (Dict): exchange_infoから取得したシンボル情報
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        return str(value)
+
+    def _sign(self, params: Dict) -> Dict:
+        """apiKey/timestampを付与してHMAC-SHA256署名する"""
+        params = dict(params, apiKey=self._api_key,
+                      timestamp=int(time.time() * 1000))
+        params = {key: self._canonicalize(params[key]) for key in params}
+        payload = "&".join(f"{key}={params[key]}" for key in sorted(params))
+        params["signature"] = self._signer.sign(payload)
+        return params
+
+    def request(self, method: str, params: Dict) -> Dict:
+        """署名済みフレームを送信し、レスポンスを同期的に待つ
+
+        送信失敗・応答タイムアウトはConnectionErrorに正規化する。
+        呼び出し側はAPIエラー（ClientError）と接続系の失敗
+        （ConnectionError）の2種類だけを扱えばよい。
         """
-        self.symbol = symbol_data['symbol']
-        self.price_precision = symbol_data['pricePrecision']
-        self.quantity_precision = symbol_data['quantityPrecision']
-        self.min_price = float(symbol_data['filters'][0]['minPrice'])
-        self.max_price = float(symbol_data['filters'][0]['maxPrice'])
-        self.tick_size = float(symbol_data['filters'][0]['tickSize'])
-        self.min_qty = float(symbol_data['filters'][1]['minQty'])
-        self.max_qty = float(symbol_data['filters'][1]['maxQty'])
-        self.step_size = float(symbol_data['filters'][1]['stepSize'])
-        self.min_notional = float(symbol_data['filters'][5]['notional'])
+        request_id = uuid.uuid4().hex
+        future = Future()
+        with self._lock:
+            self._pending[request_id] = future
+        frame = {"id": request_id, "method": method, "params": self._sign(params)}
+        try:
+            self._ws.send(orjson.dumps(frame).decode())
+        except (websocket.WebSocketException, OSError) as e:
+            with self._lock:
+                self._pending.pop(request_id, None)
+            raise ConnectionError(f"WebSocket send failed: {e}") from e
+
+        try:
+            response = future.result(timeout=self._timeout)
+        except FutureTimeoutError as e:
+            # 応答が来なかったエントリを残すと_pendingがリークする
+            with self._lock:
+                self._pending.pop(request_id, None)
+            raise ConnectionError(
+                f"WebSocket response timed out after {self._timeout}s"
+            ) from e
+        if response.get("status") != 200:
+            error = response.get("error", {})
+            raise ClientError(
+                response.get("status"), error.get("code"),
+                error.get("msg"), None
+            )
+        return response["result"]
+
+    def place_order(self, **params) -> Dict:
+        """order.placeフレームで注文を発注する"""
+        return self.request("order.place", params)
+
+    def cancel_order(self, **params) -> Dict:
+        """order.cancelフレームで注文をキャンセルする"""
+        return self.request("order.cancel", params)
+
+    def close(self):
+        """接続を閉じる（未応答のリクエストは失敗させる）"""
+        try:
+            self._ws.close()
+        except websocket.WebSocketException:
+            pass
+
+def _configure_logging() -> None:
+    """ログ設定（プロセス内で一度だけ）
+
+    クライアントを何個作ってもハンドラは増やさない。ファイルI/Oは
+    QueueListenerの専用スレッドに逃がし、発注スレッドはキューに積むだけ。
+    ログファイルはdelay=Trueで初回書き込みまで開かない。
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return
+
+    os.makedirs("logs", exist_ok=True)
+    formatter = logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    file_handler = logging.handlers.RotatingFileHandler(
+        "logs/trading.log",
+        maxBytes=10 * 1024 * 1024,
+        backupCount=5,
+        delay=True
+    )
+    stream_handler = logging.StreamHandler()
+    for handler in (file_handler, stream_handler):
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, stream_handler
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
+    root.setLevel(logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+def _use_orjson_responses(session):
+    """レスポンスのJSONデコードをorjsonに差し替える
+
+    binance-futures-connectorは内部でresponse.json()を呼ぶため、
+    セッションが返すレスポンスのjson()をorjson.loadsに向ける。
+    exchange_infoのような数百KBのペイロードでデコードが数倍速くなる。
+    """
+    original_request = session.request
+
+    def request_with_orjson(*args, **kwargs):
+        response = original_request(*args, **kwargs)
+        response.json = lambda **_: orjson.loads(response.content)
+        return response
+
+    session.request = request_with_orjson
+
+@functools.lru_cache(maxsize=1)
+def _load_api_config() -> configparser.ConfigParser:
+    """API設定ファイルの読み込み（プロセス内で一度だけパースする）"""
+    config = configparser.ConfigParser()
+    config_path = Path("settings/config.ini")
+    if not config_path.exists():
+        raise FileNotFoundError("Config file not found at settings/config.ini")
+    config.read(config_path)
+    return config
+
+@functools.lru_cache(maxsize=1)
+def _load_parameter_config() -> configparser.ConfigParser:
+    """トレードパラメータファイルの読み込み（プロセス内で一度だけパースする）"""
+    param_config = configparser.ConfigParser()
+    param_path = Path("settings/parameter.ini")
+    if not param_path.exists():
+        raise FileNotFoundError("Parameter file not found at settings/parameter.ini")
+    param_config.read(param_path)
+    return param_config
+
+@dataclass(slots=True, frozen=True)
+class SymbolInfo:
+    """シンボル情報を管理するクラス
+
+    __slots__化でインスタンス辞書を持たず、属性アクセスもスロット参照になる。
+    """
+    symbol: str
+    price_precision: int
+    quantity_precision: int
+    min_price: float
+    max_price: float
+    tick_size: float
+    min_qty: float
+    max_qty: float
+    step_size: float
+    min_notional: float
+    _tick_prec: int = field(init=False, repr=False)
+    _step_prec: int = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # 丸め精度は一度だけ求めておく。math.logベースの計算は呼び出しごとの
+        # コストに加えて0.005のような値で数値誤差を起こすため、
+        # 文字列表現の小数桁数から直接決める
+        object.__setattr__(
+            self, '_tick_prec',
+            max(0, -Decimal(str(self.tick_size)).as_tuple().exponent)
+        )
+        object.__setattr__(
+            self, '_step_prec',
+            max(0, -Decimal(str(self.step_size)).as_tuple().exponent)
+        )
+
+    @classmethod
+    def from_symbol_data(cls, symbol_data: Dict) -> "SymbolInfo":
+        """exchange_infoから取得したシンボル情報をもとに構築する"""
+        return cls(
+            symbol=symbol_data['symbol'],
+            price_precision=symbol_data['pricePrecision'],
+            quantity_precision=symbol_data['quantityPrecision'],
+            min_price=float(symbol_data['filters'][0]['minPrice']),
+            max_price=float(symbol_data['filters'][0]['maxPrice']),
+            tick_size=float(symbol_data['filters'][0]['tickSize']),
+            min_qty=float(symbol_data['filters'][1]['minQty']),
+            max_qty=float(symbol_data['filters'][1]['maxQty']),
+            step_size=float(symbol_data['filters'][1]['stepSize']),
+            min_notional=float(symbol_data['filters'][5]['notional'])
+        )
 
     def round_step_size(self, quantity: float) -> float:
-        """数量をstep_sizeに合わせて丸める"""
-        step_size = self.step_size
-        precision = int(round(-math.log(step_size, 10), 0))
-        return round(round(quantity / step_size) * step_size, precision)
+        """数量をstep_sizeに合わせて丸める（切り捨て）"""
+        # floor前のroundは 0.003 / 0.001 == 2.9999... のような表現誤差の吸収
+        steps = math.floor(round(quantity / self.step_size, 9))
+        return round(steps * self.step_size, self._step_prec)
 
     def round_tick_size(self, price: float) -> float:
-        """価格をtick_sizeに合わせて丸める"""
-        tick_size = self.tick_size
-        precision = int(round(-math.log(tick_size, 10), 0))
-        return round(round(price / tick_size) * tick_size, precision)
+        """価格をtick_sizeに合わせて丸める（切り捨て）"""
+        ticks = math.floor(round(price / self.tick_size, 9))
+        return round(ticks * self.tick_size, self._tick_prec)
 
+@dataclass(slots=True, frozen=True)
 class TradingParameters:
-    def __init__(self, symbol: str, leverage: int, side: str, 
-                 order_type: str, usdt_amount: float, reduce_only: bool = False):
-        self.symbol = symbol
-        self.leverage = leverage
-        self.side = "BUY" if side.upper() == "LONG" else "SELL"
-        self.order_type = order_type.upper()
-        self.usdt_amount = usdt_amount
-        self.reduce_only = reduce_only
+    symbol: str
+    leverage: int
+    side: str
+    order_type: str
+    usdt_amount: float
+    reduce_only: bool = False
+
+    def __post_init__(self):
+        # LONG/SHORT表記を発注用のBUY/SELLに正規化する
+        object.__setattr__(
+            self, 'side', "BUY" if self.side.upper() == "LONG" else "SELL"
+        )
+        object.__setattr__(self, 'order_type', self.order_type.upper())
 
 class BinanceFuturesClient:
-    def __init__(self, is_testnet: bool = True):
+    def __init__(self, is_testnet: bool = True, use_websocket: bool = False):
         """
         Binance Futures クライアントの初期化
         Args:
             is_testnet (bool): テストネットを使用するかどうか
+            use_websocket (bool): 発注をWebSocket APIで行うかどうか
         """
+        self._is_testnet = is_testnet
         self.config = self._load_configs()
         self.trading_params = self._load_trading_parameters()
         self.client = self._initialize_client(is_testnet)
+        self.ws_client = None
+        if use_websocket:
+            self.ws_client = WebsocketOrderClient(
+                api_key=self.config['BINANCE']['API_KEY'],
+                api_secret=self.config['BINANCE']['API_SECRET'],
+                is_testnet=is_testnet
+            )
+            # close()が呼ばれないままでもプロセス終了時に接続を閉じる
+            atexit.register(self.close)
         self._setup_logging()
         self.symbol_info = self._get_symbol_info(self.trading_params.symbol)
-        self.logger.info(f"Symbol info loaded: {vars(self.symbol_info)}")
+        self.logger.info("Symbol info loaded: %s", self.symbol_info)
 
     def _load_configs(self) -> configparser.ConfigParser:
         """API設定ファイルの読み込み"""
-        config = configparser.ConfigParser()
-        config_path = Path("settings/config.ini")
-        if not config_path.exists():
-            raise FileNotFoundError("Config file not found at settings/config.ini")
-        config.read(config_path)
-        return config
+        return _load_api_config()
 
     def _load_trading_parameters(self) -> TradingParameters:
         """トレードパラメータの読み込みと検証"""
-        param_config = configparser.ConfigParser()
-        param_path = Path("settings/parameter.ini")
-        if not param_path.exists():
-            raise FileNotFoundError("Parameter file not found at settings/parameter.ini")
-        param_config.read(param_path)
-        
-        trading_section = param_config['TRADING']
+        trading_section = _load_parameter_config()['TRADING']
         return TradingParameters(
             symbol=trading_section.get('SYMBOL'),
             leverage=trading_section.getint('LEVERAGE'),
@@ -94,109 +416,159 @@ class BinanceFuturesClient:
         api_secret = self.config['BINANCE']['API_SECRET']
         
         base_url = "https://testnet.binancefuture.com" if is_testnet else None
-        return UMFutures(
+        client = UMFutures(
             key=api_key,
             secret=api_secret,
             base_url=base_url
         )
+        # 接続を永続化し、呼び出しごとのTLSハンドシェイクを1プロセス1回に抑える
+        client.session.mount('https://', HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=50,
+            pool_block=False
+        ))
+        client.session.headers['Connection'] = 'keep-alive'
+        _use_orjson_responses(client.session)
+        return client
 
     def _setup_logging(self):
         """ログ設定"""
-        log_dir = "logs"
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir)
-            
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(f"{log_dir}/trading.log"),
-                logging.StreamHandler()
-            ]
-        )
+        _configure_logging()
         self.logger = logging.getLogger(__name__)
 
+    def _load_exchange_info(self) -> Dict:
+        """exchange_infoの取得（環境ごとのディスクキャッシュ付き）
+
+        全シンボル分で数百KBあるペイロードのため、logs/配下に保存して
+        TTL内はネットワークアクセスなしで再利用する。
+        """
+        cache_path = _exchange_info_cache_path(self._is_testnet)
+        try:
+            cache_age = time.time() - cache_path.stat().st_mtime
+            if cache_age < EXCHANGE_INFO_CACHE_TTL:
+                return orjson.loads(cache_path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            # キャッシュなし・壊れている場合は取得し直す
+            pass
+
+        exchange_info = self.client.exchange_info()
+        cache_path.parent.mkdir(exist_ok=True)
+        tmp_path = cache_path.with_suffix('.json.tmp')
+        tmp_path.write_bytes(orjson.dumps(exchange_info))
+        os.replace(tmp_path, cache_path)  # 読み手が中途半端な状態を見ないよう置換
+        return exchange_info
+
     def _get_symbol_info(self, symbol: str) -> SymbolInfo:
         """シンボル情報の取得"""
         try:
-            exchange_info = self.client.exchange_info()
-            symbol_info = next(
-                (item for item in exchange_info['symbols'] if item['symbol'] == symbol),
-                None
-            )
+            # 構築時に一度だけ取得してキャッシュし、発注経路では再取得しない
+            self._exchange_info = self._load_exchange_info()
+            self._symbol_index = {
+                item['symbol']: item for item in self._exchange_info['symbols']
+            }
+            self._symbol_info_cache: Dict[str, SymbolInfo] = {}
+            symbol_info = self._symbol_index.get(symbol)
             if not symbol_info:
                 raise ValueError(f"Symbol {symbol} not found in exchange info")
-            return SymbolInfo(symbol_info)
-        except Exception as e:
-            self.logger.error(f"Failed to get symbol info: {str(e)}")
+            return SymbolInfo.from_symbol_data(symbol_info)
+        except (ClientError, ServerError, RequestException) as e:
+            self.logger.error("Failed to get symbol info: %s", str(e))
             raise
 
+    def _resolve_symbol_info(self, symbol: str) -> SymbolInfo:
+        """シンボル自身のフィルタ情報を構築済みインデックスから取得する
+
+        parameter.iniのシンボル以外の注文をtick_size/step_sizeの違う
+        設定シンボルのフィルタで丸めないよう、発注経路はここを通す。
+        構築結果はシンボルごとにメモ化する。
+        """
+        if symbol == self.symbol_info.symbol:
+            return self.symbol_info
+        info = self._symbol_info_cache.get(symbol)
+        if info is None:
+            symbol_data = self._symbol_index.get(symbol)
+            if not symbol_data:
+                raise ValueError(f"Symbol {symbol} not found in exchange info")
+            info = SymbolInfo.from_symbol_data(symbol_data)
+            self._symbol_info_cache[symbol] = info
+        return info
+
     def _get_current_price(self, symbol: str) -> float:
         """現在の価格を取得"""
         try:
             ticker = self.client.mark_price(symbol=symbol)
             return float(ticker['markPrice'])
         except ClientError as e:
-            self.logger.error(f"Failed to get current price: {e.error_message}")
+            self.logger.error("Failed to get current price: %s", e.error_message)
             raise
 
-    def _calculate_quantity(self, usdt_amount: float, current_price: float) -> float:
-        """USDTベースの数量から実際の取引数量を計算"""
-        try:
-            # 最小注文金額のチェックと調整
-            if usdt_amount < self.symbol_info.min_notional:
-                self.logger.warning(
-                    f"USDT amount {usdt_amount} is less than minimum notional {self.symbol_info.min_notional}. "
-                    f"Adjusting to minimum notional."
-                )
-                usdt_amount = self.symbol_info.min_notional
+    def _calculate_quantity(self, usdt_amount: float, current_price: float,
+                            symbol_info: Optional[SymbolInfo] = None) -> float:
+        """USDTベースの数量から実際の取引数量を計算
 
-            raw_quantity = usdt_amount / current_price
-            
-            # 最小数量チェック
-            if raw_quantity < self.symbol_info.min_qty:
-                # 最小数量を使用し、それに見合うようにUSDT金額を増やす
-                raw_quantity = self.symbol_info.min_qty
-                adjusted_usdt = raw_quantity * current_price
-                if adjusted_usdt < self.symbol_info.min_notional:
-                    raw_quantity = self.symbol_info.min_notional / current_price
-                    self.logger.warning(
-                        f"Adjusted quantity to meet minimum notional requirement. "
-                        f"New quantity: {raw_quantity}"
-                    )
-            
-            # 最大数量チェック
-            if raw_quantity > self.symbol_info.max_qty:
-                self.logger.warning(
-                    f"Calculated quantity {raw_quantity} is more than maximum allowed {self.symbol_info.max_qty}. "
-                    f"Adjusting to maximum quantity."
-                )
-                raw_quantity = self.symbol_info.max_qty
-            
-            # step sizeに合わせて丸める
-            final_quantity = self.symbol_info.round_step_size(raw_quantity)
-            
-            # 最終チェック: 注文の名目価値
-            notional_value = final_quantity * current_price
-            if notional_value < self.symbol_info.min_notional:
+        Args:
+            usdt_amount (float): 注文金額（USDT）
+            current_price (float): 現在価格
+            symbol_info (Optional[SymbolInfo]):
+                丸めに使うシンボルのフィルタ情報。省略時はparameter.iniの
+                シンボルのものを使う。
+        """
+        if symbol_info is None:
+            symbol_info = self.symbol_info
+
+        # 最小注文金額のチェックと調整
+        if usdt_amount < symbol_info.min_notional:
+            self.logger.warning(
+                "USDT amount %s is less than minimum notional %s. "
+                "Adjusting to minimum notional.",
+                usdt_amount, symbol_info.min_notional
+            )
+            usdt_amount = symbol_info.min_notional
+
+        raw_quantity = usdt_amount / current_price
+
+        # 最小数量チェック
+        if raw_quantity < symbol_info.min_qty:
+            # 最小数量を使用し、それに見合うようにUSDT金額を増やす
+            raw_quantity = symbol_info.min_qty
+            adjusted_usdt = raw_quantity * current_price
+            if adjusted_usdt < symbol_info.min_notional:
+                raw_quantity = symbol_info.min_notional / current_price
                 self.logger.warning(
-                    f"Final order notional value ({notional_value} USDT) is less than minimum required "
-                    f"({self.symbol_info.min_notional} USDT). Adjusting quantity."
+                    "Adjusted quantity to meet minimum notional requirement. "
+                    "New quantity: %s", raw_quantity
                 )
-                final_quantity = math.ceil(self.symbol_info.min_notional / current_price * 1000) / 1000
 
-            self.logger.info(
-                f"Quantity calculation: USDT Amount: {usdt_amount}, "
-                f"Price: {current_price}, "
-                f"Final Quantity: {final_quantity}, "
-                f"Notional Value: {final_quantity * current_price}"
+        # 最大数量チェック
+        if raw_quantity > symbol_info.max_qty:
+            self.logger.warning(
+                "Calculated quantity %s is more than maximum allowed %s. "
+                "Adjusting to maximum quantity.",
+                raw_quantity, symbol_info.max_qty
             )
-            
-            return final_quantity
+            raw_quantity = symbol_info.max_qty
 
-        except Exception as e:
-            self.logger.error(f"Error in calculate quantity: {str(e)}")
-            raise
+        # step sizeに合わせて丸める
+        final_quantity = symbol_info.round_step_size(raw_quantity)
+
+        # 最終チェック: 注文の名目価値
+        notional_value = final_quantity * current_price
+        if notional_value < symbol_info.min_notional:
+            self.logger.warning(
+                "Final order notional value (%s USDT) is less than minimum required "
+                "(%s USDT). Adjusting quantity.",
+                notional_value, symbol_info.min_notional
+            )
+            final_quantity = math.ceil(symbol_info.min_notional / current_price * 1000) / 1000
+
+        self.logger.info(
+            "Quantity calculation: USDT Amount: %s, Price: %s, "
+            "Final Quantity: %s, Notional Value: %s",
+            usdt_amount, current_price, final_quantity,
+            final_quantity * current_price
+        )
+        
+        return final_quantity
 
     def _set_leverage(self, symbol: str, leverage: int):
         """レバレッジを設定"""
@@ -205,20 +577,189 @@ class BinanceFuturesClient:
                 symbol=symbol,
                 leverage=leverage
             )
-            self.logger.info(f"Leverage set to {leverage}x for {symbol}")
+            self.logger.info("Leverage set to %sx for %s", leverage, symbol)
+        except ClientError as e:
+            self.logger.error("Failed to set leverage: %s", e.error_message)
+            raise
+
+    def _prepare_symbol(self, symbol: str, leverage: int) -> float:
+        """レバレッジ設定と現在価格取得を並行実行する
+
+        両者はデータ依存がないため、逐次実行（レイテンシの和）ではなく
+        並行実行（レイテンシの最大値）で待ち時間を短縮する。
+        Returns:
+            float: 現在のマーク価格
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            price_future = executor.submit(self._get_current_price, symbol)
+            leverage_future = executor.submit(self._set_leverage, symbol, leverage)
+            leverage_future.result()
+            return price_future.result()
+
+    def _build_batch_order_params(self, params: TradingParameters, current_price: float) -> Dict:
+        """TradingParametersからbatchOrders用の注文パラメータを構築
+
+        batchOrdersは数値フィールドを文字列で要求するためstr()変換する。
+        数量・価格の丸めには注文シンボル自身のフィルタを使う。
+        """
+        symbol_info = self._resolve_symbol_info(params.symbol)
+        quantity = self._calculate_quantity(
+            params.usdt_amount, current_price, symbol_info
+        )
+        order_params = {
+            "symbol": params.symbol,
+            "side": params.side,
+            "type": params.order_type,
+            "quantity": str(quantity),
+            "reduceOnly": "true" if params.reduce_only else "false"
+        }
+
+        if params.order_type == "LIMIT":
+            adjustment = 0.99 if params.side == "BUY" else 1.01
+            price = symbol_info.round_tick_size(current_price * adjustment)
+            order_params["price"] = str(price)
+            order_params["timeInForce"] = "GTC"
+
+        return order_params
+
+    def build_order_params(self, params: TradingParameters, current_price: float) -> Dict:
+        """place_order用のパラメータを事前計算する
+
+        数量計算・価格丸めをワーカーの外で済ませておき、
+        ワーカーはPOSTだけを行えるようにする。丸めには
+        注文シンボル自身のフィルタを使う。
+        """
+        symbol_info = self._resolve_symbol_info(params.symbol)
+        order_params = {
+            "symbol": params.symbol,
+            "side": params.side,
+            "order_type": params.order_type,
+            "quantity": self._calculate_quantity(
+                params.usdt_amount, current_price, symbol_info
+            ),
+            "reduce_only": params.reduce_only
+        }
+
+        if params.order_type == "LIMIT":
+            adjustment = 0.99 if params.side == "BUY" else 1.01
+            order_params["price"] = symbol_info.round_tick_size(
+                current_price * adjustment
+            )
+            order_params["time_in_force"] = "GTC"
+
+        return order_params
+
+    def place_orders_parallel(self, params_list: List[TradingParameters],
+                              workers: int = 8) -> List[Dict]:
+        """複数注文をワーカースレッドで並列発注する
+
+        クライアント（TLS接続・シンボル情報・レバレッジ設定）は全ワーカーで
+        共有し、レバレッジ設定と価格取得はシンボルごとに一度だけ行う。
+        同時発注数の上限はレートリミッタが抑える。
+        Args:
+            params_list (List[TradingParameters]): 発注する注文のリスト
+            workers (int): ワーカースレッド数
+        Returns:
+            List[Dict]: 成功した注文のレスポンスのリスト
+        """
+        prices = {}
+        order_queue = queue.Queue()
+        for params in params_list:
+            if params.symbol not in prices:
+                prices[params.symbol] = self._prepare_symbol(
+                    params.symbol, params.leverage
+                )
+            order_queue.put(self.build_order_params(params, prices[params.symbol]))
+
+        results = []
+        results_lock = threading.Lock()
+
+        def worker():
+            while True:
+                try:
+                    order_params = order_queue.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    response = self.place_order(**order_params)
+                    with results_lock:
+                        results.append(response)
+                except (ClientError, ServerError, RequestException,
+                        ConnectionError) as e:
+                    # ワーカーを殺さず、失敗を記録して残りの注文を続行する
+                    self.logger.error("Parallel order failed: %s", e)
+                finally:
+                    order_queue.task_done()
+
+        threads = [
+            threading.Thread(target=worker)
+            for _ in range(min(workers, len(params_list)))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.logger.info("Placed %s/%s orders", len(results), len(params_list))
+        return results
+
+    def place_batch_orders(self, orders: List[Dict]) -> List[Dict]:
+        """複数の注文を/fapi/v1/batchOrdersでまとめて発注する
+
+        1リクエストあたり最大5注文のため、5件ずつに分割して送信する。
+        注文ごとのHTTPラウンドトリップを1/5に削減できる。
+        Args:
+            orders (List[Dict]): batchOrders形式の注文パラメータのリスト
+        Returns:
+            List[Dict]: 各注文のレスポンスのリスト
+        """
+        try:
+            responses = []
+            for i in range(0, len(orders), MAX_BATCH_ORDERS):
+                chunk = orders[i:i + MAX_BATCH_ORDERS]
+                # バッチ内の各注文もレート上限にカウントされる
+                _order_rate_limiter.acquire(len(chunk))
+                response = self.client.sign_request(
+                    "POST",
+                    "/fapi/v1/batchOrders",
+                    {"batchOrders": orjson.dumps(chunk).decode()}
+                )
+                responses.extend(response)
+                self.logger.info("Batch of %s orders placed: %s", len(chunk), response)
+            return responses
+
         except ClientError as e:
-            self.logger.error(f"Failed to set leverage: {e.error_message}")
+            self.logger.error("Failed to place batch orders: %s", e.error_message)
             raise
 
-    def prepare_and_place_order(self) -> Dict:
-        """パラメータに基づいて注文を準備して発注"""
+    def prepare_and_place_order(self, params_list: Optional[List[TradingParameters]] = None) -> Dict:
+        """パラメータに基づいて注文を準備して発注
+
+        Args:
+            params_list (Optional[List[TradingParameters]]):
+                複数指定した場合はbatchOrdersでまとめて発注する。
+                省略時はparameter.iniの設定で単一注文を発注する。
+        """
         try:
-            # レバレッジを設定
-            self._set_leverage(self.trading_params.symbol, self.trading_params.leverage)
-            
-            # 現在価格を取得
-            current_price = self._get_current_price(self.trading_params.symbol)
-            
+            # 複数注文はbatchOrdersでまとめて発注
+            if params_list:
+                prices = {}
+                orders = []
+                for params in params_list:
+                    if params.symbol not in prices:
+                        prices[params.symbol] = self._prepare_symbol(
+                            params.symbol, params.leverage
+                        )
+                    orders.append(
+                        self._build_batch_order_params(params, prices[params.symbol])
+                    )
+                return self.place_batch_orders(orders)
+
+            # レバレッジ設定と現在価格取得を並行実行
+            current_price = self._prepare_symbol(
+                self.trading_params.symbol, self.trading_params.leverage
+            )
+
             # 数量を計算
             quantity = self._calculate_quantity(
                 self.trading_params.usdt_amount, 
@@ -244,11 +785,11 @@ class BinanceFuturesClient:
                 order_params["price"] = price
                 order_params["time_in_force"] = "GTC"
                 
-            self.logger.info(f"Placing order with params: {order_params}")
+            self.logger.info("Placing order with params: %s", order_params)
             return self.place_order(**order_params)
             
-        except Exception as e:
-            self.logger.error(f"Error in prepare_and_place_order: {str(e)}")
+        except (ClientError, ServerError, RequestException, ValueError) as e:
+            self.logger.error("Error in prepare_and_place_order: %s", str(e))
             raise
 
     def place_order(
@@ -279,12 +820,16 @@ class BinanceFuturesClient:
                     "timeInForce": time_in_force
                 })
 
-            response = self.client.new_order(**params)
-            self.logger.info(f"Order placed successfully: {response}")
+            _order_rate_limiter.acquire()
+            if self.ws_client:
+                response = self.ws_client.place_order(**params)
+            else:
+                response = self.client.new_order(**params)
+            self.logger.info("Order placed successfully: %s", response)
             return response
 
         except ClientError as e:
-            self.logger.error(f"Failed to place order: {e.error_message}")
+            self.logger.error("Failed to place order: %s", e.error_message)
             raise
         
     def get_position_info(self) -> Dict:
@@ -293,19 +838,21 @@ class BinanceFuturesClient:
             positions = self.client.get_position_risk(
                 symbol=self.trading_params.symbol
             )
-            self.logger.info(f"Position info retrieved: {positions}")
+            self.logger.info("Position info retrieved: %s", positions)
             return positions
         except ClientError as e:
-            self.logger.error(f"Failed to get position info: {e.error_message}")
+            self.logger.error("Failed to get position info: %s", e.error_message)
             raise
 
     def get_exchange_info(self) -> Dict:
-        """取引所の情報を取得"""
-        try:
-            return self.client.exchange_info()
-        except ClientError as e:
-            self.logger.error(f"Failed to get exchange info: {e.error_message}")
-            raise
+        """取引所の情報を取得（構築時のキャッシュを返す）"""
+        return self._exchange_info
+
+    def close(self):
+        """WebSocket接続を閉じる（複数回呼んでも安全）"""
+        if self.ws_client is not None:
+            self.ws_client.close()
+            self.ws_client = None
 
 if __name__ == "__main__":
     try: